@@ -6,6 +6,7 @@
 """weedb driver for the MySQL database"""
 
 import decimal
+import functools
 
 try:
     import MySQLdb
@@ -45,25 +46,46 @@ exception_map = {
 }
 
 
+@functools.lru_cache(maxsize=256)
+def _qmark_to_pct(sql_string):
+    """Translate the ?'s in a SQL statement into the %s placeholders MySQL uses.
+
+    Most workloads execute the same handful of statement templates over and over,
+    so the translation is memoized."""
+    return sql_string.replace('?', '%s')
+
+
 def guard(fn):
     """Decorator function that converts MySQL exceptions into weedb exceptions."""
 
+    # Bind these once, in the closure, rather than looking them up as globals on
+    # every wrapped call:
+    get_exception = exception_map.get
+    default_exception = weedb.DatabaseError
+
+    @functools.wraps(fn)
     def guarded_fn(*args, **kwargs):
         try:
             return fn(*args, **kwargs)
         except MySQLDatabaseError as e:
-            # Get the MySQL exception number out of e:
-            try:
-                errno = e.args[0]
-            except (IndexError, AttributeError):
-                errno = None
-            # Default exception is weedb.DatabaseError
-            klass = exception_map.get(errno, weedb.DatabaseError)
-            raise klass(e)
+            # Get the MySQL exception number out of e. Default exception
+            # is weedb.DatabaseError
+            errno = e.args[0] if e.args else None
+            raise get_exception(errno, default_exception)(e)
 
     return guarded_fn
 
 
+def _quote_identifier(name):
+    """Quote a database or table name as a MySQL identifier.
+
+    Backtick quoting keeps names with unusual characters from being parsed as SQL.
+    A name containing a backtick cannot be quoted safely, so reject it outright."""
+    if '`' in name:
+        raise weedb.ProgrammingError("Invalid identifier '%s'" % name)
+    return '`%s`' % name
+
+
 def connect(host='localhost', user='', password='', database_name='',
             driver='', port=3306, engine=DEFAULT_ENGINE, autocommit=True, **kwargs):
     """Connect to the specified database"""
@@ -85,7 +107,7 @@ def create(host='localhost', user='', password='', database_name='',
                     **kwargs) as connect:
         with connect.cursor() as cursor:
             # Now create the database.
-            cursor.execute("CREATE DATABASE %s" % (database_name,))
+            cursor.execute("CREATE DATABASE %s" % _quote_identifier(database_name))
 
 
 def drop(host='localhost', user='', password='', database_name='',
@@ -100,7 +122,7 @@ def drop(host='localhost', user='', password='', database_name='',
                     autocommit=autocommit,
                     **kwargs) as connect:
         with connect.cursor() as cursor:
-            cursor.execute("DROP DATABASE %s" % database_name)
+            cursor.execute("DROP DATABASE %s" % _quote_identifier(database_name))
 
 
 class Connection(weedb.Connection):
@@ -149,9 +171,9 @@ class Connection(weedb.Connection):
         # Get a cursor directly from MySQL
         with self.connection.cursor() as cursor:
             cursor.execute("""SHOW TABLES;""")
-            while True:
-                row = cursor.fetchone()
-                if row is None: break
+            # A DBAPI cursor is its own iterator, so just iterate over it rather
+            # than calling fetchone() until it returns None.
+            for row in cursor:
                 # Extract the table name. In case it's in unicode, convert to a regular string.
                 table_list.append(str(row[0]))
         return table_list
@@ -166,25 +188,22 @@ class Connection(weedb.Connection):
             # If the table does not exist, this will raise a MySQL ProgrammingError exception,
             # which gets converted to a weedb.OperationalError exception by the guard decorator
             cursor.execute("""SHOW COLUMNS IN %s;""" % table)
-            irow = 0
-            while True:
-                row = cursor.fetchone()
-                if row is None:
-                    break
+            for irow, row in enumerate(cursor):
                 # Append this column to the list of columns.
                 colname = str(row[0])
-                if row[1].upper() == 'DOUBLE':
+                # Uppercase the type just once per row:
+                coltype_upper = str(row[1]).upper()
+                if coltype_upper == 'DOUBLE':
                     coltype = 'REAL'
-                elif row[1].upper().startswith('INT'):
+                elif coltype_upper.startswith('INT'):
                     coltype = 'INTEGER'
-                elif row[1].upper().startswith('CHAR'):
+                elif coltype_upper.startswith('CHAR'):
                     coltype = 'STR'
                 else:
-                    coltype = str(row[1]).upper()
+                    coltype = coltype_upper
                 is_primary = True if row[3] == 'PRI' else False
                 can_be_null = False if row[2] == '' else to_bool(row[2])
                 yield (irow, colname, coltype, can_be_null, row[4], is_primary)
-                irow += 1
 
     @guard
     def columnsOf(self, table):
@@ -239,12 +258,35 @@ class Cursor(weedb.Cursor):
         sql_tuple: A tuple with the values to be used in the placeholders."""
 
         # MySQL uses '%s' as placeholders, so replace the ?'s with %s
-        mysql_string = sql_string.replace('?', '%s')
+        mysql_string = _qmark_to_pct(sql_string)
 
         # Convert sql_tuple to a plain old tuple, just in case it actually
         # derives from tuple, but overrides the string conversion (as is the
-        # case with a TimeSpan object):
-        self.cursor.execute(mysql_string, tuple(sql_tuple))
+        # case with a TimeSpan object). If it already is a plain tuple, use it
+        # as is, saving an allocation:
+        params = sql_tuple if type(sql_tuple) is tuple else tuple(sql_tuple)
+        self.cursor.execute(mysql_string, params)
+
+        return self
+
+    @guard
+    def executemany(self, sql_string, sql_seq):
+        """Execute a SQL statement once for each row of parameters.
+
+        sql_string: A SQL statement to be executed. It should use ? as a placeholder.
+
+        sql_seq: A sequence of tuples, one per execution, with the values to be
+        used in the placeholders.
+
+        The underlying MySQL driver batches multi-row INSERTs into a single
+        statement, so this is much cheaper than calling execute() in a loop."""
+
+        mysql_string = _qmark_to_pct(sql_string)
+
+        # As in execute(), make sure each row really is a plain old tuple:
+        self.cursor.executemany(mysql_string,
+                                [sql_tuple if type(sql_tuple) is tuple else tuple(sql_tuple)
+                                 for sql_tuple in sql_seq])
 
         return self
 
@@ -261,8 +303,12 @@ class Cursor(weedb.Cursor):
         column_names: A set (or list) of column names to be dropped. It is not an error to try to drop
         a non-existent column.
         """
-        for column_name in column_names:
-            self.execute("ALTER TABLE %s DROP COLUMN %s;" % (table, column_name))
+        if not column_names:
+            return
+        # MySQL allows several DROP COLUMN clauses in a single ALTER TABLE, so issue
+        # one statement and rebuild the table once, rather than once per column:
+        drop_clauses = ", ".join("DROP COLUMN %s" % column_name for column_name in column_names)
+        self.execute("ALTER TABLE %s %s;" % (table, drop_clauses))
 
     def close(self):
         try:
@@ -294,10 +340,15 @@ class Cursor(weedb.Cursor):
 # This is a utility function for converting a result set that might contain
 # longs or decimal.Decimals (which MySQLdb uses) to something containing just ints.
 #
+
+# Build the type tuple once, rather than once per element inside the comprehension below:
+_INT_TYPES = (int, decimal.Decimal)
+
+
 def _massage(seq):
     # Return the _massaged sequence if it exists, otherwise, return None
     if seq is not None:
-        return [int(i) if isinstance(i, (int, decimal.Decimal)) else i for i in seq]
+        return [int(i) if isinstance(i, _INT_TYPES) else i for i in seq]
 
 
 def set_engine(connect, engine):
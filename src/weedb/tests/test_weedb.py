@@ -133,6 +133,28 @@ class Common(unittest.TestCase):
                 self.assertIsNotNone(_row)
                 self.assertIsNone(_row[0])
 
+    def test_executemany(self):
+        # Create the database and schema
+        weedb.create(self.db_dict)
+        with weedb.connect(self.db_dict) as _connect:
+            with _connect.cursor() as _cursor:
+                _cursor.execute("CREATE TABLE test1 (dateTime INTEGER NOT NULL UNIQUE PRIMARY KEY,"
+                                " x REAL);")
+                # Insert a batch of rows in one call:
+                _cursor.executemany("INSERT INTO test1 (dateTime, x) VALUES (?, ?)",
+                                    [(i, i + 1) for i in range(10)])
+
+                # Now read them back:
+                _cursor.execute("SELECT dateTime, x FROM test1 ORDER BY dateTime")
+                for i, _row in enumerate(_cursor):
+                    self.assertEqual(_row[0], i)
+                    self.assertEqual(_row[1], i + 1)
+
+                # A duplicate key within a batch must come back as a weedb exception:
+                with self.assertRaises(weedb.IntegrityError):
+                    _cursor.executemany("INSERT INTO test1 (dateTime, x) VALUES (?, ?)",
+                                        [(20, 21), (0, 1)])
+
     def test_bad_select(self):
         self.populate_db()
         with weedb.connect(self.db_dict) as _connect:
@@ -246,8 +268,8 @@ class TestMySQL(Common):
 
 def suite():
     tests = ['test_drop', 'test_double_create', 'test_no_db', 'test_no_tables',
-             'test_create', 'test_bad_table', 'test_select', 'test_bad_select',
-             'test_rollback', 'test_transaction', 'test_variable']
+             'test_create', 'test_bad_table', 'test_select', 'test_executemany',
+             'test_bad_select', 'test_rollback', 'test_transaction', 'test_variable']
     return unittest.TestSuite(list(map(TestSqlite, tests)) + list(map(TestMySQL, tests)))
 
 
@@ -6,6 +6,7 @@
 """Routines for generating image plots."""
 
 import colorsys
+import functools
 import locale
 import os
 import time
@@ -26,6 +27,39 @@ else:
     PIL_HAS_BBOX = True
 
 
+@functools.lru_cache(maxsize=4096)
+def _fmt_num(label_format, x):
+    """Format a number for use as an axis label, caching the results.
+
+    Successive renders of the same plot keep asking for the same labels, so memoizing
+    the (locale-aware, hence relatively expensive) formatting pays off."""
+    return locale.format_string(label_format, x)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_time(label_format, x):
+    """Format an epoch time for use as an axis label, caching the results."""
+    time_tuple = time.localtime(x)
+    # A pure-ASCII format cannot trip over a non-Unicode strftime, so take the
+    # straight path for the common case. (Not str.isascii(), which needs Python 3.7.)
+    if all(ord(ch) < 128 for ch in label_format):
+        return time.strftime(label_format, time_tuple)
+    # There are still some strftimes out there that don't support Unicode.
+    try:
+        label = time.strftime(label_format, time_tuple)
+    except UnicodeEncodeError:
+        # Convert it to UTF8, then back again:
+        label = time.strftime(label_format.encode('utf-8'), time_tuple).decode('utf-8')
+    return label
+
+
+# Cache of rendered plot "templates" — everything except the plot lines, the bottom
+# label, and the rose. Keyed on the full non-data configuration of the plot (see
+# _templateKey()). Evicted oldest-first once full.
+_template_cache = {}
+_TEMPLATE_CACHE_MAX = 20
+
+
 class GeneralPlot:
     """Holds various parameters necessary for a plot. It should be specialized by the type of plot.
     """
@@ -104,7 +138,11 @@ class GeneralPlot:
         self.rose_width             = int(plot_dict.get('rose_width', 21))
         self.rose_height            = int(plot_dict.get('rose_height', 21))
         self.rose_diameter          = int(plot_dict.get('rose_diameter', 10))
-        self.rose_position          = (self.lmargin + self.padding + 5, self.image_height - self.bmargin - self.padding - self.rose_height)
+        # The rose is composited onto the final image after any anti-alias resolve, so
+        # its position is in native (unsupersampled) coordinates:
+        self.rose_position          = ((self.lmargin + self.padding) // self.anti_alias + 5,
+                                       (self.image_height - self.bmargin - self.padding)
+                                       // self.anti_alias - self.rose_height)
         self.rose_rotation          = None
         self.rose_label             = plot_dict.get('rose_label', 'N')
         self.rose_label_font_path   = plot_dict.get('rose_label_font_path', self.bottom_label_font_path)
@@ -196,6 +234,59 @@ class GeneralPlot:
         them and returning the results as a new Image object.
         """
 
+        self._calcXScaling()
+        self._calcYScaling()
+        self._calcXLabelFormat()
+        self._calcYLabelFormat()
+
+        # Everything except the plot lines, the bottom label, and the rose is a pure
+        # function of the configuration and the scaling. WeeWX regenerates the same
+        # plots every report cycle, and for aggregate plots the scaling holds still for
+        # hours at a time, so cache the rendered "template" and start each render from
+        # a copy of it. The bottom label is drawn per-render: the image generator sets
+        # it to the report timestamp, which changes every cycle.
+        key = self._templateKey()
+        template = _template_cache.get(key)
+        if template is None:
+            # Evict oldest-first once the cache is full:
+            if len(_template_cache) >= _TEMPLATE_CACHE_MAX:
+                _template_cache.pop(next(iter(_template_cache)))
+            template = _template_cache[key] = self._renderTemplate()
+
+        image = template.copy()
+        draw = ImageDraw.ImageDraw(image)
+        self._renderBottom(draw)
+        sdraw = self._getScaledDraw(draw)
+        self._renderPlotLines(sdraw)
+
+        if self.anti_alias != 1:
+            # Resolve the supersampled image down to the requested size. A plain box
+            # average is exactly what supersampling calls for, and Image.reduce() is much
+            # cheaper than the Lanczos resample thumbnail() would do. Image.reduce()
+            # requires Pillow 7.0 or later, so keep a fallback for older versions.
+            if hasattr(image, 'reduce'):
+                image = image.reduce(self.anti_alias)
+            else:
+                image.thumbnail((self.image_width / self.anti_alias,
+                                 self.image_height / self.anti_alias),
+                                Image.LANCZOS)
+            draw = ImageDraw.ImageDraw(image)
+
+        # The rose is drawn at its native size, so composite it onto the final,
+        # native-size image, rather than pasting it into the supersampled image and
+        # letting the anti-alias resolve shrink it away.
+        if self.render_rose:
+            self._renderRose(image, draw)
+
+        return image
+
+    def _renderTemplate(self):
+        """Render the data-independent parts of the plot: the background, the top band,
+        the day/night bands, and the axes.
+
+        Returns:
+            Image: A new Image object, suitable for caching.
+        """
         # NB: In what follows the variable 'draw' is an instance of an ImageDraw object and is in pixel units.
         # The variable 'sdraw' is an instance of ScaledDraw and its units are in the "scaled" units of the plot
         # (e.g., the horizontal scaling might be for seconds, the vertical for degrees Fahrenheit.)
@@ -205,30 +296,46 @@ class GeneralPlot:
                         (self.image_width - self.rmargin, self.image_height - self.bmargin)),
                         fill=self.chart_background_color)
 
-        self._renderBottom(draw)
         self._renderTopBand(draw)
 
-        self._calcXScaling()
-        self._calcYScaling()
-        self._calcXLabelFormat()
-        self._calcYLabelFormat()
-
         sdraw = self._getScaledDraw(draw)
         if self.show_daynight:
-            self._renderDayNight(sdraw)
+            self._renderDayNight(sdraw, image)
         self._renderXAxes(sdraw)
         self._renderYAxes(sdraw)
-        self._renderPlotLines(sdraw)
-        if self.render_rose:
-            self._renderRose(image, draw)
-
-        if self.anti_alias != 1:
-            image.thumbnail((self.image_width / self.anti_alias,
-                             self.image_height / self.anti_alias),
-                            Image.LANCZOS)
 
         return image
 
+    def _templateKey(self):
+        """Return a hashable key covering everything _renderTemplate() draws, plus the
+        margin geometry it draws within.
+
+        Must be called after the scaling and label formats have been calculated."""
+        # Subclasses draw the axes differently (e.g. TimePlot._genXLabel), so the key
+        # starts with the class itself:
+        return (type(self),
+                self.image_width, self.image_height, self.anti_alias,
+                # The margins are derived from settings (such as bottom_label_font_size)
+                # that do not appear in the key themselves, so key on them directly —
+                # that way the key cannot drift from the geometry:
+                self.lmargin, self.rmargin, self.bmargin, self.tmargin,
+                self.tbandht, self.padding,
+                self.image_background_color, self.chart_background_color,
+                self.chart_gridline_color, tuple(self.chart_line_colors),
+                self.top_label_font_path, self.top_label_font_size,
+                self.unit_label, self.unit_label_font_path,
+                self.unit_label_font_color, self.unit_label_font_size,
+                self.axis_label_font_path, self.axis_label_font_color,
+                self.axis_label_font_size,
+                self.x_label_format, self.y_label_format,
+                self.x_label_spacing, self.y_label_spacing, self.y_label_side,
+                self.xscale, self.yscale,
+                self.show_daynight, self.daynight_day_color, self.daynight_night_color,
+                self.daynight_edge_color, self.daynight_gradient,
+                self.latitude, self.longitude,
+                # The top band holds the label of each line, in the line's color:
+                tuple((line.label, line.color) for line in self.line_list))
+
     def _getScaledDraw(self, draw):
         """Returns an instance of ScaledDraw, with the appropriate scaling.
         
@@ -247,21 +354,39 @@ class GeneralPlot:
         )
         return sdraw
 
-    def _renderDayNight(self, sdraw):
+    def _renderDayNight(self, sdraw, image):
         """Draw vertical bands for day/night."""
         (first, transitions) = weeutil.weeutil.getDayNightTransitions(
             self.xscale[0], self.xscale[1], self.latitude, self.longitude)
         color = self.daynight_day_color \
             if first == 'day' else self.daynight_night_color
+        # A chart that is entirely day or entirely night has no transitions: a single
+        # fill covers it, and there is no band, gradient, or edge work to do.
+        if not transitions:
+            sdraw.rectangle(((self.xscale[0], self.yscale[0]),
+                             (self.xscale[1], self.yscale[1])), fill=color)
+            return
+        # The pixel extent of the chart area:
+        x_left = sdraw.xtranslate(self.xscale[0])
+        x_right = sdraw.xtranslate(self.xscale[1])
+        y_top = sdraw.ytranslate(self.yscale[1])
+        y_bottom = sdraw.ytranslate(self.yscale[0])
+        # Rasterize the bands into a 1-pixel-high strip, then stretch the strip over the
+        # chart and paste it in a single operation, rather than filling one full-height
+        # rectangle per band.
+        strip = Image.new("RGB", (x_right - x_left + 1, 1))
+        strip_draw = ImageDraw.ImageDraw(strip)
         xleft = self.xscale[0]
         for x in transitions:
-            sdraw.rectangle(((xleft,self.yscale[0]),
-                             (x,self.yscale[1])), fill=color)
+            strip_draw.rectangle(((sdraw.xtranslate(xleft) - x_left, 0),
+                                  (sdraw.xtranslate(x) - x_left, 0)), fill=color)
             xleft = x
             color = self.daynight_night_color \
                 if color == self.daynight_day_color else self.daynight_day_color
-        sdraw.rectangle(((xleft,self.yscale[0]),
-                         (self.xscale[1],self.yscale[1])), fill=color)
+        strip_draw.rectangle(((sdraw.xtranslate(xleft) - x_left, 0),
+                              (x_right - x_left, 0)), fill=color)
+        image.paste(strip.resize((x_right - x_left + 1, y_bottom - y_top + 1), Image.NEAREST),
+                    (x_left, y_top))
         if self.daynight_gradient:
             if first == 'day':
                 color1 = self.daynight_day_color
@@ -275,14 +400,22 @@ class GeneralPlot:
             for i in range(len(transitions)):
                 last_ = self.xscale[0] if i == 0 else transitions[i-1]
                 next_ = transitions[i+1] if i < len(transitions)-1 else self.xscale[1]
-                for z in range(1,nfade):
-                    c = blend_hls(color2, color1, float(z)/float(nfade))
-                    rgbc = int2rgbstr(c)
-                    x1 = transitions[i]-d*(nfade+1)/2+d*z
-                    if last_ < x1 < next_:
-                        sdraw.rectangle(((x1, self.yscale[0]),
-                                         (x1+d, self.yscale[1])),
-                                        fill=rgbc)
+                # The gradient band is centered on the transition, one step of width d per
+                # color in the strip. Clip the steps to the neighboring transitions:
+                zlist = [z for z in range(1, nfade)
+                         if last_ < transitions[i] - d * (nfade+1) / 2 + d * z < next_]
+                if zlist:
+                    x_start = sdraw.xtranslate(transitions[i] - d*(nfade+1)/2 + d*zlist[0])
+                    x_stop  = sdraw.xtranslate(transitions[i] - d*(nfade+1)/2 + d*zlist[-1] + d)
+                    if x_stop > x_start:
+                        # Rather than drawing one rectangle per gradient step (each requiring
+                        # an HLS blend), stretch the cached gradient strip over the band and
+                        # paste it in one go.
+                        strip = _gradient_strip(color1, color2, nfade)
+                        band = strip.crop((zlist[0] - 1, 0, zlist[-1], 1)) \
+                                    .resize((x_stop - x_start + 1, y_bottom - y_top + 1),
+                                            Image.NEAREST)
+                        image.paste(band, (x_start, y_top))
                 if color1 == self.daynight_day_color:
                     color1 = self.daynight_night_color
                     color2 = self.daynight_day_color
@@ -300,22 +433,27 @@ class GeneralPlot:
         axis_label_font = weeplot.utilities.get_font_handle(self.axis_label_font_path,
                                                             self.axis_label_font_size)
 
-        drawlabelcount = 0
-        for x in weeutil.weeutil.stampgen(self.xscale[0], self.xscale[1], self.xscale[2]) :
+        # Materialize the tick positions, so the gridlines and labels can each be drawn
+        # in a tight loop.
+        ticks = list(weeutil.weeutil.stampgen(self.xscale[0], self.xscale[1], self.xscale[2]))
+
+        # Draw the (constant x) gridlines...
+        for x in ticks:
             sdraw.line((x, x),
                        (self.yscale[0], self.yscale[1]),
                        fill=self.chart_gridline_color,
                        width=self.anti_alias)
-            if drawlabelcount % self.x_label_spacing == 0 :
-                xlabel = self._genXLabel(x)
-                if PIL_HAS_BBOX:
-                    axis_label_width = sdraw.draw.textlength(xlabel, font=axis_label_font)
-                else:
-                    axis_label_width, _ = sdraw.draw.textsize(xlabel, font=axis_label_font)
-                xpos = sdraw.xtranslate(x)
-                sdraw.draw.text((xpos - axis_label_width/2, self.image_height - self.bmargin + 2),
-                                xlabel, fill=self.axis_label_font_color, font=axis_label_font)
-            drawlabelcount += 1
+
+        # ...then a label under every x_label_spacing'th tick:
+        for x in ticks[::self.x_label_spacing]:
+            xlabel = self._genXLabel(x)
+            if PIL_HAS_BBOX:
+                axis_label_width = weeplot.utilities.get_text_width(axis_label_font, xlabel)
+            else:
+                axis_label_width, _ = sdraw.draw.textsize(xlabel, font=axis_label_font)
+            xpos = sdraw.xtranslate(x)
+            sdraw.draw.text((xpos - axis_label_width/2, self.image_height - self.bmargin + 2),
+                            xlabel, fill=self.axis_label_font_color, font=axis_label_font)
 
     def _renderYAxes(self, sdraw):
         """Draws the y-axis and horizontal constant-y lines, as well as the labels.
@@ -325,51 +463,59 @@ class GeneralPlot:
         axis_label_font = weeplot.utilities.get_font_handle(self.axis_label_font_path,
                                                             self.axis_label_font_size)
 
-        # Draw the (constant y) grid lines 
-        for i in range(nygridlines) :
-            y = self.yscale[0] + i * self.yscale[2]
+        ticks = [self.yscale[0] + i * self.yscale[2] for i in range(nygridlines)]
+
+        # Draw the (constant y) grid lines...
+        for y in ticks:
             sdraw.line((self.xscale[0], self.xscale[1]), (y, y), fill=self.chart_gridline_color,
                        width=self.anti_alias)
-            # Draw a label on every other line:
-            if i % self.y_label_spacing == 0 :
-                ylabel = self._genYLabel(y)
-                if PIL_HAS_BBOX:
-                    left, top, right, bottom = axis_label_font.getbbox(ylabel)
-                    axis_label_width, axis_label_height = right - left, bottom - top
-                else:
-                    axis_label_width, axis_label_height = sdraw.draw.textsize(ylabel,
-                                                                              font=axis_label_font)
-                ypos = sdraw.ytranslate(y)
-                # We want to treat Truetype and bitmapped fonts the same. By default, Truetype
-                # measures the top of the bounding box at the top of the ascender, while it's
-                # the top of the text for bitmapped. Specify an anchor of "lt" (left, top) for
-                # both. NB: argument "anchor" has been around at least as early as
-                # Pillow V5.0 (2018), but was not implemented until V8.0.0.
-                if self.y_label_side == 'left' or self.y_label_side == 'both':
-                    sdraw.draw.text((self.lmargin - axis_label_width - 2, ypos - axis_label_height/2),
-                                    ylabel, fill=self.axis_label_font_color, font=axis_label_font,
-                                    anchor="lt")
-                if self.y_label_side == 'right' or self.y_label_side == 'both':
-                    sdraw.draw.text((self.image_width - self.rmargin + 4, ypos - axis_label_height/2),
-                                    ylabel, fill=self.axis_label_font_color, font=axis_label_font,
-                                    anchor="lt")
+
+        # ...then a label on every y_label_spacing'th line:
+        for y in ticks[::self.y_label_spacing]:
+            ylabel = self._genYLabel(y)
+            if PIL_HAS_BBOX:
+                left, top, right, bottom = weeplot.utilities.get_text_bbox(axis_label_font,
+                                                                           ylabel)
+                axis_label_width, axis_label_height = right - left, bottom - top
+            else:
+                axis_label_width, axis_label_height = sdraw.draw.textsize(ylabel,
+                                                                          font=axis_label_font)
+            ypos = sdraw.ytranslate(y)
+            # We want to treat Truetype and bitmapped fonts the same. By default, Truetype
+            # measures the top of the bounding box at the top of the ascender, while it's
+            # the top of the text for bitmapped. Specify an anchor of "lt" (left, top) for
+            # both. NB: argument "anchor" has been around at least as early as
+            # Pillow V5.0 (2018), but was not implemented until V8.0.0.
+            if self.y_label_side == 'left' or self.y_label_side == 'both':
+                sdraw.draw.text((self.lmargin - axis_label_width - 2, ypos - axis_label_height/2),
+                                ylabel, fill=self.axis_label_font_color, font=axis_label_font,
+                                anchor="lt")
+            if self.y_label_side == 'right' or self.y_label_side == 'both':
+                sdraw.draw.text((self.image_width - self.rmargin + 4, ypos - axis_label_height/2),
+                                ylabel, fill=self.axis_label_font_color, font=axis_label_font,
+                                anchor="lt")
 
     def _renderPlotLines(self, sdraw):
         """Draw the collection of lines, using a different color for each one. Because there is
         a limited set of colors, they need to be recycled if there are very many lines.
         """
         nlines = len(self.line_list)
-        ncolors = len(self.chart_line_colors)
-        nfcolors = len(self.chart_fill_colors)
-        nwidths = len(self.chart_line_widths)
+        # Hoist the attributes used on every iteration into locals:
+        chart_line_colors = self.chart_line_colors
+        chart_fill_colors = self.chart_fill_colors
+        chart_line_widths = self.chart_line_widths
+        anti_alias = self.anti_alias
+        ncolors = len(chart_line_colors)
+        nfcolors = len(chart_fill_colors)
+        nwidths = len(chart_line_widths)
 
         # Draw them in reverse order, so the first line comes out on top of the image
         for j, this_line in enumerate(self.line_list[::-1]):
 
             iline=nlines-j-1
-            color = self.chart_line_colors[iline%ncolors] if this_line.color is None else this_line.color
-            fill_color = self.chart_fill_colors[iline%nfcolors] if this_line.fill_color is None else this_line.fill_color
-            width = (self.chart_line_widths[iline%nwidths] if this_line.width is None else this_line.width) * self.anti_alias
+            color = chart_line_colors[iline%ncolors] if this_line.color is None else this_line.color
+            fill_color = chart_fill_colors[iline%nfcolors] if this_line.fill_color is None else this_line.fill_color
+            width = (chart_line_widths[iline%nwidths] if this_line.width is None else this_line.width) * anti_alias
 
             # Calculate the size of a gap in data
             maxdx = None
@@ -379,7 +525,7 @@ class GeneralPlot:
             if this_line.plot_type == 'line':
                 ms = this_line.marker_size
                 if ms is not None:
-                    ms *= self.anti_alias
+                    ms *= anti_alias
                 sdraw.line(this_line.x,
                            this_line.y,
                            line_type=this_line.line_type,
@@ -389,10 +535,21 @@ class GeneralPlot:
                            width = width,
                            maxdx = maxdx)
             elif this_line.plot_type == 'bar' :
+                # Hoist the scaling factors into locals and call the PIL rectangle
+                # function directly. For a dense bar plot, going through
+                # sdraw.rectangle() for every point is mostly call overhead.
+                xscale, xoffset = sdraw.xscale, sdraw.xoffset
+                yscale, yoffset = sdraw.yscale, sdraw.yoffset
+                draw_rectangle = sdraw.draw.rectangle
+                ybottom = int(self.yscale[0] * yscale + yoffset + 0.5)
                 for x, y, bar_width in zip(this_line.x, this_line.y, this_line.bar_width):
                     if y is None:
                         continue
-                    sdraw.rectangle(((x - bar_width, self.yscale[0]), (x, y)), fill=fill_color, outline=color)
+                    draw_rectangle(((int((x - bar_width) * xscale + xoffset + 0.5),
+                                     int(y * yscale + yoffset + 0.5)),
+                                    (int(x * xscale + xoffset + 0.5),
+                                     ybottom)),
+                                   fill=fill_color, outline=color)
             elif this_line.plot_type == 'vector' :
                 for (x, vec) in zip(this_line.x, this_line.y):
                     sdraw.vector(x, vec,
@@ -409,7 +566,8 @@ class GeneralPlot:
         bottom_label_font = weeplot.utilities.get_font_handle(self.bottom_label_font_path,
                                                               self.bottom_label_font_size)
         if PIL_HAS_BBOX:
-            left, top, right, bottom = bottom_label_font.getbbox(self.bottom_label)
+            left, top, right, bottom = weeplot.utilities.get_text_bbox(bottom_label_font,
+                                                                       self.bottom_label)
             bottom_label_width, bottom_label_height = right - left, bottom - top
         else:
             bottom_label_width, bottom_label_height = draw.textsize(self.bottom_label,
@@ -447,14 +605,18 @@ class GeneralPlot:
         top_label_font = weeplot.utilities.get_font_handle(self.top_label_font_path,
                                                            self.top_label_font_size)
 
-        # The top label is the appended label_list. However, it has to be drawn in segments 
-        # because each label may be in a different color. For now, append them together to get
-        # the total width
-        top_label = u' '.join([line.label for line in self.line_list])
+        # The top label has to be drawn in segments because each label may be in a
+        # different color. Measure each label (and the separating space) once: the sum
+        # centers the block, and the individual widths advance x as the labels are drawn.
         if PIL_HAS_BBOX:
-            top_label_width= draw.textlength(top_label, font=top_label_font)
+            space_width = weeplot.utilities.get_text_width(top_label_font, u' ')
+            label_widths = [weeplot.utilities.get_text_width(top_label_font, line.label)
+                            for line in self.line_list]
         else:
-            top_label_width, _ = draw.textsize(top_label, font=top_label_font)
+            space_width = draw.textsize(u' ', font=top_label_font)[0]
+            label_widths = [draw.textsize(line.label, font=top_label_font)[0]
+                            for line in self.line_list]
+        top_label_width = sum(label_widths) + space_width * max(len(label_widths) - 1, 0)
 
         x = (self.image_width - top_label_width)/2
         y = 0
@@ -465,11 +627,7 @@ class GeneralPlot:
             # Draw a label
             draw.text( (x,y), this_line.label, fill = color, font = top_label_font)
             # Now advance the width of the label we just drew, plus a space:
-            if PIL_HAS_BBOX:
-                label_width = draw.textlength(this_line.label + u' ', font= top_label_font)
-            else:
-                label_width, _ = draw.textsize(this_line.label + u' ', font= top_label_font)
-            x += label_width
+            x += label_widths[i] + space_width
 
     def _renderRose(self, image, draw):
         """Draw a compass rose."""
@@ -511,7 +669,8 @@ class GeneralPlot:
         rose_label_font = weeplot.utilities.get_font_handle(self.rose_label_font_path,
                                                             self.rose_label_font_size)
         if PIL_HAS_BBOX:
-            left, top, right, bottom = rose_label_font.getbbox(self.rose_label)
+            left, top, right, bottom = weeplot.utilities.get_text_bbox(rose_label_font,
+                                                                       self.rose_label)
             rose_label_width, rose_label_height = right - left, bottom - top
         else:
             rose_label_width, rose_label_height = draw.textsize(self.rose_label,
@@ -541,21 +700,24 @@ class GeneralPlot:
     def _calcYScaling(self):
         """Calculates y scaling. Can be used 'as-is' for most purposes."""
         # The filter is necessary because unfortunately the value 'None' is not
-        # excluded from min and max (i.e., min(None, x) is not necessarily x). 
-        # The try block is necessary because min of an empty list throws a
+        # excluded from min and max (i.e., min(None, x) is not necessarily x).
+        # The try block is necessary because min of an empty sequence throws a
         # ValueError exception.
         ymin = ymax = None
         for line in self.line_list:
             if line.plot_type == 'vector':
                 try:
                     # For progressive vector plots, we want the magnitude of the complex vector
-                    yline_max = max(abs(c) for c in [v for v in line.y if v is not None])
+                    yline_max = max(abs(c) for c in line.y if c is not None)
                 except ValueError:
                     yline_max = None
                 yline_min = - yline_max if yline_max is not None else None
             else:
-                yline_min = min_with_none(line.y)
-                yline_max = max_with_none(line.y)
+                # Strip out the Nones once, then let the C implementations of min() and
+                # max() do the scans, rather than looping over the data twice in Python.
+                yvals = [v for v in line.y if v is not None]
+                yline_min = min(yvals) if yvals else None
+                yline_max = max(yvals) if yvals else None
             ymin = min_with_none([ymin, yline_min])
             ymax = max_with_none([ymax, yline_max])
 
@@ -574,18 +736,17 @@ class GeneralPlot:
             self.y_label_format = weeplot.utilities.pickLabelFormat(self.yscale[2])
 
     def _genXLabel(self, x):
-        xlabel = locale.format_string(self.x_label_format, x)
-        return xlabel
+        return _fmt_num(self.x_label_format, x)
 
     def _genYLabel(self, y):
-        ylabel = locale.format_string(self.y_label_format, y)
-        return ylabel
+        return _fmt_num(self.y_label_format, y)
 
     def _calcXMinMax(self):
         xmin = xmax = None
         for line in self.line_list:
-            xline_min = min_with_none(line.x)
-            xline_max = max_with_none(line.x)
+            # The x extent of each line was calculated once, when the line was created:
+            xline_min = line.x_min
+            xline_max = line.x_max
             # If the line represents a bar chart, then the actual minimum has to
             # be adjusted for the bar width of the first point
             if line.plot_type == 'bar':
@@ -621,23 +782,27 @@ class TimePlot(GeneralPlot) :
         """Specialized version for time plots. Assumes that time is in unix epoch time."""
         if self.x_label_format is None:
             return u''
-        time_tuple = time.localtime(x)
-        # There are still some strftimes out there that don't support Unicode.
-        try:
-            xlabel = time.strftime(self.x_label_format, time_tuple)
-        except UnicodeEncodeError:
-            # Convert it to UTF8, then back again:
-            xlabel = time.strftime(self.x_label_format.encode('utf-8'), time_tuple).decode('utf-8')
-        return xlabel
+        return _fmt_time(self.x_label_format, x)
 
 
 class PlotLine:
     """Represents a single line (or bar) in a plot. """
+
+    # A plot can carry many lines, each holding thousands of points, so skip the
+    # per-instance __dict__:
+    __slots__ = ('x', 'y', 'x_min', 'x_max', 'label', 'plot_type', 'line_type',
+                 'marker_type', 'marker_size', 'color', 'fill_color', 'width',
+                 'bar_width', 'vector_rotate', 'line_gap_fraction')
+
     def __init__(self, x, y, label='', color=None, fill_color=None, width=None, plot_type='line',
                  line_type='solid', marker_type=None, marker_size=10,
                  bar_width=None, vector_rotate = None, line_gap_fraction=None):
         self.x               = x
         self.y               = y
+        # The x vector never changes once the line has been created, so calculate its
+        # extent once, rather than on every render:
+        self.x_min           = min_with_none(x)
+        self.x_max           = max_with_none(x)
         self.label           = label
         self.plot_type       = plot_type
         self.line_type       = line_type
@@ -651,18 +816,121 @@ class PlotLine:
         self.line_gap_fraction = line_gap_fraction
 
 
+@functools.lru_cache(maxsize=32)
+def _gradient_strip(color1, color2, nfade):
+    """Return a 1-pixel-high image fading from color1 to color2 in nfade-1 steps.
+
+    The strip is cached, so the (pure Python, hence slow) HLS blends are done only once
+    per color pair. Callers crop and resize the strip to cover a day/night transition,
+    replacing one rectangle fill per gradient step with a single paste."""
+    strip = Image.new("RGB", (nfade - 1, 1))
+    colors = blend_array(color2, color1, [float(z) / float(nfade) for z in range(1, nfade)])
+    for z, c in enumerate(colors):
+        strip.putpixel((z, 0), int2rgb(c))
+    return strip
+
+
+@functools.lru_cache(maxsize=4096)
 def blend_hls(c, bg, alpha):
     """Fade from c to bg using alpha channel where 1 is solid and 0 is
-    transparent.  This fades across the hue, saturation, and lightness."""
+    transparent.  This fades across the hue, saturation, and lightness.
+
+    The results are memoized: gradients keep blending the same pair of colors at the
+    same handful of fractions, and the underlying HLS math is pure Python."""
     return blend(c, bg, alpha, alpha, alpha)
 
 
+def blend_array(c, bg, alphas):
+    """Blend c into bg at each of a sequence of fractions, as blend_hls() would.
+
+    Unpacking and converting the two endpoint colors, and working out the shortest hue
+    path between them, is done once, outside the per-fraction loop — the bulk of what
+    blend() does over for every call.
+
+    Args:
+        c (int): The color being faded in, as a little-endian integer.
+        bg (int): The background color, as a little-endian integer.
+        alphas (iterable[float]): The blend fractions, where 1 is solid c and 0 is bg.
+
+    Returns:
+        list[int]: One blended color per fraction, as little-endian integers.
+    """
+    h1, l1, s1 = _int_to_hls(c)
+    h2, l2, s2 = _int_to_hls(bg)
+
+    # See blend() for the reasoning behind the hue juggling:
+    if s1 == 0: h1 = h2
+    if s2 == 0: h2 = h1
+
+    # The signed length of the short way around the color wheel from h2 to h1.
+    # See blend() for the derivation:
+    h_span = (h1 - h2 + 0.5) % 1.0 - 0.5
+
+    hls_to_rgb = _hls_to_rgb
+    results = []
+    for alpha in alphas:
+        h = (h2 + h_span * alpha) % 1.0
+        l = alpha * l1 + (1 - alpha) * l2
+        s = alpha * s1 + (1 - alpha) * s2
+        r, g, b = hls_to_rgb(h, l, s)
+        results.append(rgb2int(int(round(r * 255.0)),
+                               int(round(g * 255.0)),
+                               int(round(b * 255.0))))
+    return results
+
+
+def build_gradient(c, bg, n, mode='hls'):
+    """Build a color ramp from bg to c, for callers that would otherwise call
+    blend_hls() or blend_ls() in a loop.
+
+    Args:
+        c (int): The color being faded in, as a little-endian integer.
+        bg (int): The background color, as a little-endian integer.
+        n (int): The number of colors wanted.
+        mode (str): Either 'hls' (fade hue, lightness, and saturation, as
+            blend_hls() does), or 'ls' (hold the hue, as blend_ls() does).
+
+    Returns:
+        list[int]: n colors as little-endian integers, running from solid bg
+            at index 0 to solid c at index n-1.
+    """
+    if n <= 0:
+        return []
+    if n == 1:
+        return [c]
+    alphas = [z / (n - 1) for z in range(n)]
+    if mode == 'hls':
+        return blend_array(c, bg, alphas)
+    elif mode == 'ls':
+        return [blend_ls(c, bg, alpha) for alpha in alphas]
+    raise ValueError("Unknown gradient mode '%s'" % mode)
+
+
+@functools.lru_cache(maxsize=4096)
 def blend_ls(c, bg, alpha):
     """Fade from c to bg where 1 is solid and 0 is transparent.
-    Change only the lightness and saturation, not hue."""
+    Change only the lightness and saturation, not hue. Results are memoized."""
     return blend(c, bg, 1.0, alpha, alpha)
 
 
+# Module-level aliases, saving an attribute lookup per call in the blend math below:
+_rgb_to_hls = colorsys.rgb_to_hls
+_hls_to_rgb = colorsys.hls_to_rgb
+
+# Multiplying by the reciprocal is cheaper than dividing:
+_INV255 = 1.0 / 255.0
+
+
+@functools.lru_cache(maxsize=512)
+def _int_to_hls(x):
+    """Convert a little-endian integer color to an (h, l, s) tuple, caching the results.
+
+    Blends keep hitting the same few endpoint colors, and the RGB-to-HLS conversion is
+    the most expensive part of unpacking them."""
+    r, g, b = int2rgb(x)
+    return _rgb_to_hls(r * _INV255, g * _INV255, b * _INV255)
+
+
 def blend(c, bg, alpha_h, alpha_l, alpha_s):
     """Fade from c to bg in the hue, lightness, saturation colorspace.
        Added hue directionality to choose the shortest circular hue path e.g.
@@ -671,38 +939,30 @@ def blend(c, bg, alpha_h, alpha_l, alpha_s):
        http://davidjohnstone.net/pages/lch-lab-colour-gradient-picker
        """
 
-    r1,g1,b1 = int2rgb(c)
-    h1,l1,s1 = colorsys.rgb_to_hls(r1/255.0, g1/255.0, b1/255.0)
+    h1,l1,s1 = _int_to_hls(c)
+    h2,l2,s2 = _int_to_hls(bg)
 
-    r2,g2,b2 = int2rgb(bg)
-    h2,l2,s2 = colorsys.rgb_to_hls(r2/255.0, g2/255.0, b2/255.0)
+    # If both endpoints are grey, the blend is just a lightness lerp — skip the
+    # hue juggling and the HLS-to-RGB conversion entirely. This is the common case
+    # for the default axis and grid colors:
+    if s1 == 0 and s2 == 0:
+        v = int(round((alpha_l * l1 + (1 - alpha_l) * l2) * 255.0))
+        return rgb2int(v, v, v)
 
     # Check if either of the values is grey (saturation 0),
     # in which case don't needlessly reset hue to '0', reducing travel around colour wheel
     if s1 == 0: h1 = h2
     if s2 == 0: h2 = h1
 
-    h_delta = h2 - h1
-
-    if abs(h_delta) > 0.5:
-        # If interpolating over more than half-circle (0.5 radians) take shorter, opposite direction...
-        h_range = 1.0 - abs(h_delta)
-        h_dir = +1.0 if h_delta < 0.0 else -1.0
-
-        # Calculte h based on line back from h2 as proportion of h_range and alpha
-        h = h2 - ( h_dir * h_range * alpha_h )
-
-        # Clamp h within 0.0 to 1.0 range
-        h = h + 1.0 if h < 0.0 else h
-        h = h - 1.0 if h > 1.0 else h
-    else:
-        # Interpolating over less than a half-circle, so use normal interpolation as before
-        h = alpha_h * h1 + (1 - alpha_h) * h2
+    # Interpolate the hue along the shorter way around the color wheel. The inner
+    # modulo maps the hue difference into [-0.5, 0.5) — the signed length of the
+    # short path — so no separate test for the wrap-around case is needed:
+    h = (h2 + ((h1 - h2 + 0.5) % 1.0 - 0.5) * alpha_h) % 1.0
 
     l = alpha_l * l1 + (1 - alpha_l) * l2
     s = alpha_s * s1 + (1 - alpha_s) * s2
 
-    r,g,b = colorsys.hls_to_rgb(h, l, s)
+    r,g,b = _hls_to_rgb(h, l, s)
 
     r = round(r * 255.0)
     g = round(g * 255.0)
@@ -714,24 +974,20 @@ def blend(c, bg, alpha_h, alpha_l, alpha_s):
 
 
 def int2rgb(x):
-    b = (x >> 16) & 0xff
-    g = (x >> 8) & 0xff
-    r = x & 0xff
-    return r,g,b
+    # int.to_bytes does the unpacking in a single C call:
+    return (*x.to_bytes(3, 'little'),)
 
 
+@functools.lru_cache(maxsize=256)
 def int2rgbstr(x):
     return '#%02x%02x%02x' % int2rgb(x)
 
 
 def rgb2int(r,g,b):
-    return r + g*256 + b*256*256
+    return int.from_bytes((r, g, b), 'little')
 
 
+@functools.lru_cache(maxsize=64)
 def add_alpha(i):
     """Add an opaque alpha channel to an integer RGB value"""
-    r = i & 0xff
-    g = (i >> 8)  & 0xff
-    b = (i >> 16) & 0xff
-    a = 0xff    # Opaque alpha
-    return r,g,b,a
+    return (*i.to_bytes(3, 'little'), 0xff)
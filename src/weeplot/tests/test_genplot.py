@@ -0,0 +1,93 @@
+#
+#    Copyright (c) 2009-2024 Tom Keffer <tkeffer@gmail.com>
+#
+#    See the file LICENSE.txt for your full rights.
+#
+"""Test the plot generator in weeplot.genplot"""
+
+import math
+import os
+import time
+import unittest
+
+from PIL import Image, ImageDraw
+
+import weeplot.genplot
+from weeplot.genplot import TimePlot, PlotLine
+
+
+def make_plot(plot_dict=None, bottom_label=u'bottom label',
+              start="2013-05-17 08:00", nhours=24):
+    """Build a simple time plot with one line of data."""
+    os.environ['TZ'] = 'America/Los_Angeles'
+    time.tzset()
+    pd = {'image_width': 300, 'image_height': 180}
+    if plot_dict:
+        pd.update(plot_dict)
+    plot = TimePlot(pd)
+    t0 = time.mktime(time.strptime(start, "%Y-%m-%d %H:%M"))
+    x = [t0 + i * 300 for i in range(nhours * 12)]
+    y = [20.0 + 10.0 * math.sin(i / 20.0) for i in range(len(x))]
+    plot.addLine(PlotLine(x, y, label='line'))
+    plot.setBottomLabel(bottom_label)
+    plot.setUnitLabel(u'degF')
+    return plot
+
+
+class TemplateCacheTest(unittest.TestCase):
+    """Test the cache of rendered plot templates."""
+
+    def setUp(self):
+        weeplot.genplot._template_cache.clear()
+
+    def test_repeat_render(self):
+        """Rendering the same plot twice must be byte-identical."""
+        cold = make_plot().render()
+        warm = make_plot().render()
+        self.assertEqual(warm.tobytes(), cold.tobytes())
+
+    def test_no_stale_geometry(self):
+        """A warm cache must not leak one plot's margin geometry into another.
+
+        bottom_label_font_size feeds bmargin, which positions the chart rectangle and
+        the x-axis labels, so a plot differing only in that size must not reuse another
+        plot's template."""
+        cold = make_plot({'bottom_label_font_size': 20}).render()
+        weeplot.genplot._template_cache.clear()
+        make_plot().render()
+        warm = make_plot({'bottom_label_font_size': 20}).render()
+        self.assertEqual(warm.tobytes(), cold.tobytes())
+
+    def test_bottom_label_not_in_key(self):
+        """The bottom label changes every report cycle, and must not key the cache."""
+        first = make_plot(bottom_label=u'05/17/13 08:00').render()
+        second = make_plot(bottom_label=u'05/17/13 08:05').render()
+        self.assertEqual(len(weeplot.genplot._template_cache), 1)
+        # But the label itself must still be drawn:
+        self.assertNotEqual(second.tobytes(), first.tobytes())
+
+
+class DayNightTest(unittest.TestCase):
+    """Test the rendering of the day/night bands."""
+
+    def test_day_only(self):
+        """An x range that stays within one phase gets a single uniform fill."""
+        # Three hours in the middle of a midsummer morning: no transitions.
+        plot = make_plot({'show_daynight': 'true'}, start="2013-06-21 09:00", nhours=3)
+        plot.setLocation(45.0, -122.0)
+        plot._calcXScaling()
+        plot._calcYScaling()
+        image = Image.new("RGB", (plot.image_width, plot.image_height),
+                          plot.image_background_color)
+        sdraw = plot._getScaledDraw(ImageDraw.ImageDraw(image))
+        plot._renderDayNight(sdraw, image)
+        # The whole chart area (the pixel extent of the scales) must end up one color:
+        chart = image.crop((sdraw.xtranslate(plot.xscale[0]),
+                            sdraw.ytranslate(plot.yscale[1]),
+                            sdraw.xtranslate(plot.xscale[1]) + 1,
+                            sdraw.ytranslate(plot.yscale[0]) + 1))
+        self.assertEqual(len(chart.getcolors()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@
 """Various utilities used by the plot package."""
 
 import datetime
+import functools
 import math
 import time
 
@@ -388,10 +389,18 @@ class ScaledDraw:
 
         For a scatter plot, set line_type to None and marker_type to something other than None.
         """
+        # Hoist the affine factors into locals: for a line with thousands of points,
+        # going through the xtranslate()/ytranslate() methods for every point is mostly
+        # attribute-lookup and call overhead.
+        xscale, xoffset = self.xscale, self.xoffset
+        yscale, yoffset = self.yscale, self.yoffset
+
         # Break the line around any nulls or gaps between samples
         for xy_seq in xy_seq_line(x, y, maxdx):
             # Create a list with the scaled coordinates...
-            xy_seq_scaled = [(self.xtranslate(xc), self.ytranslate(yc)) for (xc, yc) in xy_seq]
+            xy_seq_scaled = [(int(xc * xscale + xoffset + 0.5),
+                              int(yc * yscale + yoffset + 0.5))
+                             for (xc, yc) in xy_seq]
             if line_type == 'solid':
                 # Now pick the appropriate drawing function, depending on the length of the line:
                 if len(xy_seq) == 1:
@@ -560,13 +569,13 @@ def pickLabelFormat(increment):
     return u"%%.%df" % decimal_places
 
 
+@functools.lru_cache(maxsize=128)
 def get_font_handle(fontpath_str, *args):
-    """Get a handle for a font path, caching the results"""
+    """Get a handle for a font path, caching the results.
 
-    # Look for the font in the cache
-    font_key = (fontpath_str, args)
-    if font_key in get_font_handle.fontCache:
-        return get_font_handle.fontCache[font_key]
+    Because opening and parsing a TrueType font is expensive, the results are memoized,
+    so repeated calls with the same path and size return the same font object. Use
+    clear_font_cache() to invalidate the cache (e.g., after a skin reload)."""
 
     font = None
     if fontpath_str is not None:
@@ -597,12 +606,29 @@ def get_font_handle(fontpath_str, *args):
 
     if font is None:
         font = ImageFont.load_default()
-    if font is not None:
-        get_font_handle.fontCache[font_key] = font
     return font
 
 
-get_font_handle.fontCache = {}
+@functools.lru_cache(maxsize=1024)
+def get_text_bbox(font, text):
+    """Return the bounding box of a string of text, caching the results.
+
+    Axis labels are drawn from a small vocabulary of repeated strings, so memoizing the
+    metrics avoids a FreeType layout pass for every tick of every plot."""
+    return font.getbbox(text)
+
+
+@functools.lru_cache(maxsize=1024)
+def get_text_width(font, text):
+    """Return the width of a string of text in pixels, caching the results."""
+    return font.getlength(text)
+
+
+def clear_font_cache():
+    """Empty the font cache. Useful when the fonts on disk may have changed."""
+    get_font_handle.cache_clear()
+    get_text_bbox.cache_clear()
+    get_text_width.cache_clear()
 
 
 def _rel_approx_equal(x, y, rel=1e-7):
@@ -627,12 +653,16 @@ def _rel_approx_equal(x, y, rel=1e-7):
     return abs(x - y) <= rel * max(abs(x), abs(y))
 
 
+@functools.lru_cache(maxsize=256)
 def tobgr(x):
     """Convert a color to little-endian integer.  The PIL wants either
     a little-endian integer (0xBBGGRR) or a string (#RRGGBB).  weewx expects
     little-endian integer.  Accept any standard color format that is known
     by ImageColor for example #RGB, #RRGGBB, hslHSL as well as standard color
     names from X11 and CSS3.  See ImageColor for complete set of colors.
+
+    The results are memoized: a skin uses a small, fixed palette, and every plot of
+    every report cycle re-parses the same color strings.
     """
     if isinstance(x, str):
         if x.startswith('0x'):